@@ -9,7 +9,7 @@ import sys
 from pathlib import Path
 
 # List of GPU operations available (from src/gpu/ops/)
-GPU_OPS = {
+GPU_OPS = frozenset({
     'canny', 'sobel', 'scharr', 'laplacian',  # edge
     'gaussian_blur', 'box_blur', 'median_blur', 'bilateral_filter', 'filter2d',  # filtering
     'erode', 'dilate',  # morphology
@@ -25,17 +25,25 @@ GPU_OPS = {
     'exp', 'log', 'sqrt', 'pow',  # math
     'equalize_hist', 'integral_image', 'distance_transform',  # histogram/transform
     'gradient_magnitude'  # gradients
+})
+
+# WASM function name (with or without _wasm/_async suffixes) -> GPU function name
+WASM_TO_GPU = {
+    f"{op}{suffix}": f"{op}_gpu_async"
+    for op in GPU_OPS
+    for suffix in ('', '_wasm', '_async', '_wasm_async')
 }
 
 def has_gpu_support(op_name):
     """Check if operation likely has GPU support based on common patterns"""
-    base_name = op_name.replace('_wasm', '').replace('_async', '')
-    return base_name in GPU_OPS
+    return op_name in WASM_TO_GPU
 
 def get_gpu_function_name(op_name):
     """Convert WASM function name to GPU function name"""
-    base = op_name.replace('_wasm', '')
-    return f"{base}_gpu_async"
+    gpu_name = WASM_TO_GPU.get(op_name)
+    if gpu_name is None:
+        gpu_name = f"{op_name.replace('_wasm', '')}_gpu_async"
+    return gpu_name
 
 # Count found
 print("GPU operations available:", len(GPU_OPS))
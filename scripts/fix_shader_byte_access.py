@@ -11,80 +11,110 @@ were treating packed values as individual bytes.
 Fix: Add read_byte() and write_byte() helpers to unpack bytes correctly.
 """
 
+import mmap
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Read the byte access helpers
 HELPERS_PATH = Path("src/gpu/shaders/byte_access_helpers.wgsl")
 BYTE_ACCESS_HELPERS = HELPERS_PATH.read_text()
 
-def fix_shader(shader_path: Path) -> bool:
+# Helpers wrapped in separator comments, assembled once for every shader
+HELPERS_HEADER = (
+    "\n// === Byte Access Helpers ===\n"
+    "// Required for correct RGBA byte extraction from u32 storage buffers\n\n"
+)
+HELPERS_FOOTER = "\n// === End Byte Access Helpers ===\n\n"
+HELPERS_BLOCK = HELPERS_HEADER + BYTE_ACCESS_HELPERS + HELPERS_FOOTER
+
+# Buffer access patterns, fused into one alternation so each shader is scanned once:
+#   output[idx] = value -> write_byte(&output, idx, value)
+#   input[idx]          -> read_byte(&input, idx)   (but not input[x] =)
+# The output index may itself contain an input[...] read, e.g. output[input[i]] = v;
+BUFFER_ACCESS_RE = re.compile(
+    r'\boutput\[((?:[^\]\[]|\binput\[[^\]]+\])+)\]\s*=\s*([^;]+);'
+    r'|\binput\[([^\]]+)\](?!\s*=)'
+)
+
+def _rewrite_buffer_access(match: re.Match) -> str:
+    """Replacement callback for BUFFER_ACCESS_RE"""
+    if match.group(1) is not None:
+        # The written index and value may themselves read from input[...]
+        index = BUFFER_ACCESS_RE.sub(_rewrite_buffer_access, match.group(1))
+        value = BUFFER_ACCESS_RE.sub(_rewrite_buffer_access, match.group(2))
+        return f"write_byte(&output, {index}, {value});"
+    return f"read_byte(&input, {match.group(3)})"
+
+def _find_insert_pos(content: str) -> int:
+    """
+    Offset of the first @compute attribute or line-initial fn declaration
+
+    Plain substring searches are enough here, so the regex engine is not
+    needed. Returns -1 if neither is present.
+    """
+    # Line-initial "fn" followed by any whitespace, as ^fn\s with re.MULTILINE
+    fn_pos = 0 if content.startswith("fn") else -1
+    newline_pos = -1
+    while fn_pos < 0 or not content[fn_pos + 2:fn_pos + 3].isspace():
+        newline_pos = content.find("\nfn", newline_pos + 1)
+        if newline_pos < 0:
+            fn_pos = -1
+            break
+        fn_pos = newline_pos + 1
+
+    positions = (content.find("@compute"), fn_pos)
+    return min((pos for pos in positions if pos >= 0), default=-1)
+
+def fix_shader(shader_path: Path) -> tuple[bool, str]:
     """
     Fix a single shader file to use byte access helpers
 
-    Returns True if file was modified, False otherwise
+    Returns (modified, status) where modified is True if the file was
+    rewritten and status is the line to report for it
     """
-    print(f"Processing {shader_path.name}...")
+    # Scan the raw bytes for the sentinel tokens before decoding, so shaders
+    # that are skipped never get materialized as a Python str
+    with shader_path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False, "  ℹ No u32 arrays, skipping"
 
-    content = shader_path.read_text()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Check if already fixed
+            if mm.find(b"read_byte") >= 0:
+                return False, "  ⚠ Already fixed, skipping"
 
-    # Check if already fixed
-    if "read_byte" in content:
-        print(f"  ⚠ Already fixed, skipping")
-        return False
+            # Check if this shader uses array<u32> buffers
+            if mm.find(b"array<u32>") < 0:
+                return False, "  ℹ No u32 arrays, skipping"
 
-    # Check if this shader uses array<u32> buffers
-    if "array<u32>" not in content:
-        print(f"  ℹ No u32 arrays, skipping")
-        return False
+            # Normalize newlines like read_text() does, so CRLF shaders are
+            # written back with LF throughout rather than mixed endings
+            content = mm[:].decode().replace("\r\n", "\n").replace("\r", "\n")
 
     # Insert helpers after the struct definitions but before functions
     # Find the first @compute or fn declaration
-    insert_marker = re.search(r"(@compute|^fn\s)", content, re.MULTILINE)
-
-    if not insert_marker:
-        print(f"  ⚠ No insertion point found, skipping")
-        return False
+    insert_pos = _find_insert_pos(content)
 
-    insert_pos = insert_marker.start()
+    if insert_pos < 0:
+        return False, "  ⚠ No insertion point found, skipping"
 
     # Insert helpers with separator comments
-    new_content = (
-        content[:insert_pos] +
-        "\n// === Byte Access Helpers ===\n" +
-        "// Required for correct RGBA byte extraction from u32 storage buffers\n\n" +
-        BYTE_ACCESS_HELPERS +
-        "\n// === End Byte Access Helpers ===\n\n" +
-        content[insert_pos:]
-    )
-
-    # Now replace buffer access patterns
-    # This is a simple pattern - real shaders may need manual review
+    new_content = "".join([content[:insert_pos], HELPERS_BLOCK, content[insert_pos:]])
 
-    # Pattern 1: input[idx] -> read_byte(&input, idx)
-    # Only replace if it's clearly accessing pixel data
-    new_content = re.sub(
-        r'\binput\[([^\]]+)\](?!\s*=)',  # input[x] but not input[x] =
-        r'read_byte(&input, \1)',
-        new_content
-    )
-
-    # Pattern 2: output[idx] = value -> write_byte(&output, idx, value)
-    new_content = re.sub(
-        r'\boutput\[([^\]]+)\]\s*=\s*([^;]+);',
-        r'write_byte(&output, \1, \2);',
-        new_content
-    )
+    # Now replace buffer access patterns in a single pass
+    # This is a simple pattern - real shaders may need manual review
+    if "input[" in new_content or "output[" in new_content:
+        new_content = BUFFER_ACCESS_RE.sub(_rewrite_buffer_access, new_content)
 
     # Write back if changed
     if new_content != content:
-        shader_path.write_text(new_content)
-        print(f"  ✓ Fixed")
-        return True
+        # Encode once and write raw bytes, skipping the text-mode codec layer
+        shader_path.write_bytes(new_content.encode())
+        return True, "  ✓ Fixed"
     else:
-        print(f"  ℹ No changes needed")
-        return False
+        return False, "  ℹ No changes needed"
 
 def main():
     """Fix all shaders in src/gpu/shaders/"""
@@ -108,10 +138,16 @@ def main():
 
     print(f"Found {len(shader_files)} shader files\n")
 
+    # Shaders are independent, so fix them concurrently and report in order
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(fix_shader, shader_files))
+
     fixed_count = 0
 
-    for shader_path in shader_files:
-        if fix_shader(shader_path):
+    for shader_path, (fixed, status) in zip(shader_files, results):
+        print(f"Processing {shader_path.name}...")
+        print(status)
+        if fixed:
             fixed_count += 1
 
     print()
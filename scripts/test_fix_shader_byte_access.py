@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Fixture tests for fix_shader_byte_access.py
+
+Each case feeds a small shader through fix_shader() and compares the
+rewritten file against the expected output.
+
+Usage (from the project root):
+    python3 -m unittest scripts/test_fix_shader_byte_access.py
+"""
+
+import importlib.util
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SCRIPT_PATH = Path(__file__).resolve().parent / "fix_shader_byte_access.py"
+
+def load_script():
+    """Import the fix script, which reads its helpers relative to the project root"""
+    cwd = os.getcwd()
+    os.chdir(PROJECT_ROOT)
+    try:
+        spec = importlib.util.spec_from_file_location("fix_shader_byte_access", SCRIPT_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        os.chdir(cwd)
+    return module
+
+fix = load_script()
+
+class FixShaderTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def run_fix(self, source: bytes):
+        path = Path(self.tmp.name) / "shader.wgsl"
+        path.write_bytes(source)
+        fixed, status = fix.fix_shader(path)
+        return fixed, status, path.read_bytes()
+
+    def test_nested_input_in_output_index(self):
+        fixed, _, result = self.run_fix(
+            b"var<storage> input: array<u32>;\n"
+            b"@compute fn main() {\n"
+            b"  output[input[i]] = v;\n"
+            b"  output[i] = input[j] + input[k];\n"
+            b"}\n"
+        )
+        self.assertTrue(fixed)
+        self.assertEqual(result.decode(), (
+            "var<storage> input: array<u32>;\n"
+            + fix.HELPERS_BLOCK
+            + "@compute fn main() {\n"
+            "  write_byte(&output, read_byte(&input, i), v);\n"
+            "  write_byte(&output, i, read_byte(&input, j) + read_byte(&input, k));\n"
+            "}\n"
+        ))
+
+    def test_newline_after_fn(self):
+        fixed, _, result = self.run_fix(
+            b"var<storage> input: array<u32>;\n"
+            b"fn\nmain() {}\n"
+        )
+        self.assertTrue(fixed)
+        self.assertEqual(result.decode(), (
+            "var<storage> input: array<u32>;\n"
+            + fix.HELPERS_BLOCK
+            + "fn\nmain() {}\n"
+        ))
+
+    def test_fn_inside_line_is_not_an_insertion_point(self):
+        fixed, status, result = self.run_fix(
+            b"var<storage> input: array<u32>;\n"
+            b"  fn main() {}\n"
+        )
+        self.assertFalse(fixed)
+        self.assertIn("No insertion point found", status)
+
+    def test_crlf_shader_is_written_with_lf(self):
+        fixed, _, result = self.run_fix(
+            b"var<storage> input: array<u32>;\r\n"
+            b"@compute fn main() {\r\n"
+            b"  output[i] = input[i];\r\n"
+            b"}\r\n"
+        )
+        self.assertTrue(fixed)
+        self.assertNotIn(b"\r", result)
+        self.assertEqual(result.decode(), (
+            "var<storage> input: array<u32>;\n"
+            + fix.HELPERS_BLOCK
+            + "@compute fn main() {\n"
+            "  write_byte(&output, i, read_byte(&input, i));\n"
+            "}\n"
+        ))
+
+    def test_already_fixed_shader_is_untouched(self):
+        source = b"var<storage> input: array<u32>;\nfn f() { read_byte(&input, 0u); }\n"
+        fixed, status, result = self.run_fix(source)
+        self.assertFalse(fixed)
+        self.assertIn("Already fixed", status)
+        self.assertEqual(result, source)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,7 +14,10 @@ Usage:
 
 import os
 import numpy as np
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
+
+# Seeded so regenerated noise fixtures are reproducible
+_RNG = np.random.default_rng(seed=0)
 
 def create_lenna_alternative(size=(512, 512)):
     """
@@ -22,31 +25,27 @@ def create_lenna_alternative(size=(512, 512)):
     with varied textures and colors
     """
     img = np.zeros((size[1], size[0], 3), dtype=np.uint8)
+    half_w, half_h = size[0] // 2, size[1] // 2
+
+    # Row/column index vectors, broadcast across each quadrant
+    yy, xx = np.ogrid[:size[1], :size[0]]
+    top, bottom = yy[:half_h], yy[half_h:] - half_h
+    right = xx[:, half_w:] - half_w
 
     # Create colorful regions with different textures
     # Top-left: Red gradient
-    for y in range(size[1] // 2):
-        for x in range(size[0] // 2):
-            img[y, x] = [255 - y // 2, 0, 0]
+    img[:half_h, :half_w, 0] = 255 - top // 2
 
     # Top-right: Green gradient
-    for y in range(size[1] // 2):
-        for x in range(size[0] // 2, size[0]):
-            img[y, x] = [0, 255 - y // 2, 0]
+    img[:half_h, half_w:, 1] = 255 - top // 2
 
     # Bottom-left: Blue gradient
-    for y in range(size[1] // 2, size[1]):
-        for x in range(size[0] // 2):
-            img[y, x] = [0, 0, 255 - (y - size[1] // 2) // 2]
+    img[half_h:, :half_w, 2] = 255 - bottom // 2
 
     # Bottom-right: Mixed
-    for y in range(size[1] // 2, size[1]):
-        for x in range(size[0] // 2, size[0]):
-            img[y, x] = [
-                (x - size[0] // 2) // 2,
-                (y - size[1] // 2) // 2,
-                255 - (x - size[0] // 2) // 2
-            ]
+    img[half_h:, half_w:, 0] = right // 2
+    img[half_h:, half_w:, 1] = bottom // 2
+    img[half_h:, half_w:, 2] = 255 - right // 2
 
     # Add some circular features
     pil_img = Image.fromarray(img)
@@ -63,6 +62,12 @@ def create_lenna_alternative(size=(512, 512)):
 
     return pil_img
 
+def polygon_points(cx, cy, r, sides):
+    """Vertices of a regular polygon as a list of (x, y) tuples"""
+    angles = 2 * np.pi * np.arange(sides) / sides
+    points = np.stack([cx + r * np.cos(angles), cy + r * np.sin(angles)], axis=1)
+    return list(map(tuple, points))
+
 def create_shapes(size=(640, 480)):
     """Create an image with geometric shapes"""
     img = Image.new('RGB', size, color=(255, 255, 255))
@@ -80,20 +85,21 @@ def create_shapes(size=(640, 480)):
 
     # Pentagon
     cx, cy, r = 150, 350, 80
-    points = [(cx + r * np.cos(2 * np.pi * i / 5), cy + r * np.sin(2 * np.pi * i / 5))
-              for i in range(5)]
+    points = polygon_points(cx, cy, r, 5)
     draw.polygon(points, fill=(255, 255, 0), outline=(0, 0, 0), width=3)
 
     # Hexagon
     cx, cy, r = 400, 350, 80
-    points = [(cx + r * np.cos(2 * np.pi * i / 6), cy + r * np.sin(2 * np.pi * i / 6))
-              for i in range(6)]
+    points = polygon_points(cx, cy, r, 6)
     draw.polygon(points, fill=(255, 0, 255), outline=(0, 0, 0), width=3)
 
     return img
 
 def create_text(size=(640, 480)):
     """Create an image with text"""
+    # Imported lazily so other generators don't pay for font loading
+    from PIL import ImageFont
+
     img = Image.new('L', size, color=255)  # Grayscale
     draw = ImageDraw.Draw(img)
 
@@ -117,28 +123,26 @@ def create_text(size=(640, 480)):
 
 def create_gradient(size=(512, 512)):
     """Create smooth gradients"""
-    img = np.zeros((size[1], size[0], 3), dtype=np.uint8)
+    # float32 is plenty for 8-bit output and halves memory traffic
+    yy, xx = (axis.astype(np.float32) for axis in np.ogrid[:size[1], :size[0]])
+    half_w, half_h = size[0] * 0.5, size[1] * 0.5
 
-    for y in range(size[1]):
-        for x in range(size[0]):
-            # Radial gradient
-            dx = x - size[0] / 2
-            dy = y - size[1] / 2
-            dist = np.sqrt(dx * dx + dy * dy)
-            max_dist = np.sqrt((size[0] / 2) ** 2 + (size[1] / 2) ** 2)
-
-            intensity = int(255 * (1 - dist / max_dist))
-            img[y, x] = [
-                intensity,
-                int(255 * x / size[0]),
-                int(255 * y / size[1])
-            ]
+    # Radial gradient
+    dist = np.hypot(xx - half_w, yy - half_h)
+    max_dist = float(np.hypot(half_w, half_h))
+
+    channels = np.broadcast_arrays(
+        255 * (1 - dist / max_dist),
+        255 * xx / size[0],
+        255 * yy / size[1],
+    )
+    img = np.stack(channels, axis=-1).astype(np.uint8)
 
     return Image.fromarray(img)
 
 def create_noise(size=(512, 512)):
     """Create random noise"""
-    noise = np.random.randint(0, 256, (size[1], size[0], 3), dtype=np.uint8)
+    noise = _RNG.integers(0, 256, (size[1], size[0], 3), dtype=np.uint8)
     return Image.fromarray(noise)
 
 def create_edges(size=(512, 512)):
@@ -181,10 +185,20 @@ def main():
         'edges.png': create_edges,
     }
 
+    fixtures_dir = os.path.dirname(__file__)
+    missing = {
+        filename: generator for filename, generator in fixtures.items()
+        if not os.path.exists(os.path.join(fixtures_dir, filename))
+    }
+
+    if not missing:
+        print("  ✓ All fixtures already present, nothing to generate")
+        return
+
     for filename, generator in fixtures.items():
-        filepath = os.path.join(os.path.dirname(__file__), filename)
+        filepath = os.path.join(fixtures_dir, filename)
 
-        if os.path.exists(filepath):
+        if filename not in missing:
             print(f"  ⚠ {filename} already exists, skipping")
             continue
 